@@ -13,6 +13,8 @@ Behavior:
   - dry-run by default; use --run to perform changes
   - only move the source folder to #recycle on *clean success*
   - on irregularities/errors: log and leave source in place
+  - releases are routed by name (SxxEyy -> TV, year -> Movies), even when
+    dropped into the wrong source folder
 
 Logs:
   /mnt/jace_coda/logs/process-downloads.log
@@ -22,17 +24,25 @@ Logs:
 from __future__ import annotations
 
 import argparse
+import atexit
 import datetime as dt
+import errno
 import fcntl
 import json
 import os
+import queue
 import re
 import shutil
+import stat
 import subprocess
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Literal, Optional
 
 COMPLETE = Path("/mnt/jace_complete")
 MEDIA = Path("/mnt/jace_media")
@@ -51,19 +61,38 @@ AUDIT_FILE = LOG_DIR / "process-downloads.audit.jsonl"
 # Prevent concurrent runs (cron/UI double-fires, gateway restarts, etc.)
 LOCK_PATH = Path("/tmp/process-downloads.lock")
 
+# Releases are processed concurrently; keep the default low so we don't saturate the NAS.
+DEFAULT_JOBS = min(4, os.cpu_count() or 1)
+
 SKIP_NAMES = {".DS_Store", "#recycle", "Books", "Default", "Music"}
 
-TV_RE = re.compile(
-    r"^(?P<show>.+?)(?:[.\- ](?P<year>19\d{2}|20\d{2}))?[.\- ]S(?P<season>\d{2})E(?P<ep>\d{2})\b",
+# TV and movie release names are matched in one pass. The TV branch is tried
+# first, so "Show.2020.S01E02" is TV even though it also looks like a movie.
+RELEASE_RE = re.compile(
+    r"^(?:"
+    r"(?P<show>.+?)(?:[.\- ](?P<show_year>19\d{2}|20\d{2}))?[.\- ]S(?P<season>\d{2})E(?P<ep>\d{2})\b"
+    # Matches both "Title.Year" and "Title (Year)" folder formats
+    r"|(?P<title>.+?)(?:\.| \()(?P<year>19\d{2}|20\d{2})\b"
+    r")",
     re.IGNORECASE,
 )
-# Matches both "Title.Year" and "Title (Year)" folder formats
-MOVIE_RE = re.compile(
-    r"^(?P<title>.+?)(?:\.| \()(?P<year>19\d{2}|20\d{2})\b",
+
+# TV-looking markers in a name RELEASE_RE read as a movie; see is_misfiled_movie.
+# SEASON_MARKER_RE applies to the whole name ("Show.S02.2019..."), TV_AFTER_YEAR_RE
+# to the part starting at the parsed year: air dates ("2024.03.12"), episode-only
+# numbering ("2016.E03"), and "Part"/"Complete" packs.
+SEASON_MARKER_RE = re.compile(r"[.\- ]S\d{2}", re.IGNORECASE)
+TV_AFTER_YEAR_RE = re.compile(
+    r"^\d{4}[.\- ]\d{2}[.\- ]\d{2}|[.\- ](?:E\d{2}|Part|Complete)\b",
     re.IGNORECASE,
 )
 
+# Runs of release-name separators (dots, hyphens, whitespace); see slug_to_name.
+_SEPARATORS_RE = re.compile(r"[.\-\s]+")
+
 VIDEO_EXTS = {".mkv", ".mp4", ".avi", ".mov", ".m4v", ".wmv"}
+# Same set as a tuple, for str.endswith on lower-cased names in the directory walks.
+_VIDEO_SUFFIXES = tuple(VIDEO_EXTS)
 
 # Extensions considered potentially malicious / unsafe executables.
 THREAT_EXTS = {
@@ -73,6 +102,9 @@ THREAT_EXTS = {
 }
 
 
+ReleaseAction = Literal["rar", "vids", "extless", "none"]
+
+
 @dataclass
 class ParsedTV:
     show: str
@@ -87,79 +119,240 @@ class ParsedMovie:
     year: int
 
 
+@dataclass
+class ReleasePlan:
+    kind: str  # "tv" | "movie"
+    folder: Path
+    dest_dir: Path
+    rar: Optional[Path]
+    vids: list[Path]
+    extless: list[Path]
+
+    @property
+    def action(self) -> ReleaseAction:
+        """Which kind of content commit_release will act on (rar > vids > extless)."""
+        if self.rar:
+            return "rar"
+        if self.vids:
+            return "vids"
+        if self.extless:
+            return "extless"
+        return "none"
+
+
 def now_iso() -> str:
     return dt.datetime.now(dt.timezone.utc).isoformat()
 
 
-def log_line(msg: str) -> None:
+# Serializes log writes / log setup, and recycle moves, across worker threads.
+_log_lock = threading.Lock()
+_recycle_lock = threading.Lock()
+
+# One lock per destination dir. Episodes of the same show/season share a dest dir,
+# and move_path's exists-then-move check and `unrar -o+` aren't safe to overlap there.
+_dest_locks: dict[str, threading.Lock] = {}
+_dest_locks_guard = threading.Lock()
+
+
+def dest_lock(dest_dir: Path) -> threading.Lock:
+    with _dest_locks_guard:
+        return _dest_locks.setdefault(str(dest_dir), threading.Lock())
+
+
+# Log/audit files are opened once per run instead of open/close per line on the
+# NFS-mounted CODA_HOME. The log is line-buffered; audit lines are handed to a
+# writer thread so NAS write latency never stalls release processing.
+_log_fp = None
+_audit_fp = None
+_audit_q: Optional[queue.Queue] = None
+_audit_thread: Optional[threading.Thread] = None
+# First write error hit by the audit writer (OSError, or e.g. UnicodeEncodeError for
+# a surrogate-escaped path), and how many lines were lost since; close_logs
+# re-raises it so a broken audit log never goes unnoticed.
+_audit_error: Optional[Exception] = None
+_audit_lost = 0
+
+
+def _audit_writer(fp, q: queue.Queue) -> None:
+    global _audit_error, _audit_lost
+    while True:
+        line = q.get()
+        try:
+            if line is None:
+                return
+            if _audit_error is not None:
+                # Keep draining so audit() never blocks, but don't write past a failure.
+                _audit_lost += 1
+                continue
+            try:
+                fp.write(line)
+                if q.empty():
+                    fp.flush()
+            except Exception as exc:
+                _audit_error = exc
+                _audit_lost += 1
+        finally:
+            q.task_done()
+
+
+def open_logs() -> None:
+    global _log_fp, _audit_fp, _audit_q, _audit_thread
+    if _log_fp is not None:
+        return
     LOG_DIR.mkdir(parents=True, exist_ok=True)
-    ts = dt.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    _log_fp = LOG_FILE.open("a", encoding="utf-8", buffering=1)
+    _audit_fp = AUDIT_FILE.open("a", encoding="utf-8")
+    _audit_q = queue.Queue()
+    _audit_thread = threading.Thread(target=_audit_writer, args=(_audit_fp, _audit_q), daemon=True)
+    _audit_thread.start()
+    atexit.register(close_logs)
+
+
+def close_logs() -> None:
+    """Drain pending audit lines and close the log files.
+
+    Raises OSError if any audit line could not be written.
+    """
+    global _log_fp, _audit_fp, _audit_q, _audit_thread, _audit_error, _audit_lost
+    with _log_lock:
+        if _log_fp is None:
+            return
+        if not _audit_thread.is_alive() and _audit_error is None:
+            # Died before seeing the sentinel, so queued lines were never written.
+            _audit_error = RuntimeError("audit writer thread exited early")
+            _audit_lost = _audit_q.qsize()
+        _audit_q.put(None)
+        _audit_thread.join()
+        try:
+            _audit_fp.close()
+        except Exception as exc:
+            _audit_error = _audit_error or exc
+        _log_fp.close()
+        error, lost = _audit_error, _audit_lost
+        _log_fp = _audit_fp = _audit_q = _audit_thread = _audit_error = None
+        _audit_lost = 0
+    atexit.unregister(close_logs)
+    if error is not None:
+        raise OSError(f"writing {AUDIT_FILE} failed ({lost} line(s) lost): {error}") from error
+
+
+# (epoch second, formatted local time) of the last log line; lines in the same
+# second reuse the formatted string.
+_log_ts: tuple[int, str] = (0, "")
+
+
+def log_ts() -> str:
+    global _log_ts
+    now = int(time.time())
+    sec, ts = _log_ts
+    if sec != now:
+        ts = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+        _log_ts = (now, ts)
+    return ts
+
+
+def log_line(msg: str) -> None:
+    ts = log_ts()
     line = f"[{ts}] {msg}\n"
-    with LOG_FILE.open("a", encoding="utf-8") as f:
-        f.write(line)
-    print(line, end="")
+    with _log_lock:
+        open_logs()
+        _log_fp.write(line)
+        print(line, end="")
 
 
 def audit(event: dict) -> None:
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
     event = {"ts": now_iso(), **event}
-    with AUDIT_FILE.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(event, ensure_ascii=False) + "\n")
+    line = json.dumps(event, ensure_ascii=False) + "\n"
+    with _log_lock:
+        open_logs()
+        _audit_q.put(line)
 
 
 def slug_to_name(s: str) -> str:
-    # Release names use dots or hyphens as separators; normalize both to spaces.
-    s = s.replace(".", " ").replace("-", " ")
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    # Release names use dots or hyphens as separators; normalize both to spaces
+    # (and collapse whitespace) in a single pass.
+    return _SEPARATORS_RE.sub(" ", s).strip()
 
 
-def parse_tv(release: str) -> Optional[ParsedTV]:
-    m = TV_RE.match(release)
-    if not m:
-        return None
-    show = slug_to_name(m.group("show"))
-    year = int(m.group("year")) if m.group("year") else None
-    season = int(m.group("season"))
-    episode = int(m.group("ep"))
-    return ParsedTV(show=show, year=year, season=season, episode=episode)
-
+def is_misfiled_movie(release: str) -> bool:
+    """True if a Series/ release is really a movie and may be rerouted to Movies.
 
-def parse_movie(release: str) -> Optional[ParsedMovie]:
-    m = MOVIE_RE.match(release)
+    Only names RELEASE_RE reads as a movie *and* that carry no TV-looking marker
+    qualify; anything else in Series/ is TV we just failed to parse.
+    """
+    m = RELEASE_RE.match(release)
+    if not m or not m.group("year"):
+        return False
+    if SEASON_MARKER_RE.search(release):
+        return False
+    return not TV_AFTER_YEAR_RE.search(release[m.start("year"):])
+
+
+def parse_release(release: str) -> ParsedTV | ParsedMovie | None:
+    # Cheap rejects before the regex: shortest matches are "X.1999" / "X.S01E01";
+    # a TV season marker must follow a separator and a movie year starts with 19 or 20.
+    if len(release) < 6:
+        return None
+    low = release.lower()
+    if (
+        ".s" not in low and " s" not in low and "-s" not in low
+        and "19" not in release and "20" not in release
+    ):
+        return None
+    m = RELEASE_RE.match(release)
     if not m:
         return None
+    if m.group("season"):
+        show = slug_to_name(m.group("show"))
+        year = int(m.group("show_year")) if m.group("show_year") else None
+        season = int(m.group("season"))
+        episode = int(m.group("ep"))
+        return ParsedTV(show=show, year=year, season=season, episode=episode)
     title = slug_to_name(m.group("title"))
     year = int(m.group("year"))
     return ParsedMovie(title=title, year=year)
 
 
-def iter_items(src_root: Path) -> Iterable[Path]:
-    if not src_root.exists():
+def iter_items(src_root: Path, dirs_only: bool = False) -> Iterable[Path]:
+    try:
+        with os.scandir(src_root) as it:
+            entries = [e for e in it if e.name not in SKIP_NAMES and not e.name.startswith(".")]
+    except FileNotFoundError:
         return
-    for p in sorted(src_root.iterdir()):
-        if p.name in SKIP_NAMES:
-            continue
-        if p.name.startswith("."):
+    entries.sort(key=lambda e: e.name)
+    for e in entries:
+        if dirs_only and not e.is_dir():
             continue
-        yield p
+        yield Path(e.path)
 
 
-def find_first_rar(root: Path) -> Optional[Path]:
-    for p in root.rglob("*.rar"):
-        if p.is_file():
-            return p
-    return None
+def _ext(name: str) -> str:
+    """Lower-cased suffix of a file name, by the same rules as Path.suffix but without building a Path."""
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:].lower()
+    return ""
 
 
-def find_video_files(root: Path) -> list[Path]:
-    vids: list[Path] = []
-    for p in root.rglob("*"):
-        if not p.is_file():
+def _scandir_breadth_first(path: str | Path) -> Iterator[os.DirEntry]:
+    """Yield non-directory DirEntry objects under path, level by level (symlinks are skipped).
+
+    Uses os.scandir so callers can reuse the cached d_type/stat info instead of
+    paying a separate stat() per Path as rglob does — this matters on the NFS mounts.
+    """
+    pending: deque[str | Path] = deque([path])
+    while pending:
+        try:
+            with os.scandir(pending.popleft()) as it:
+                for e in it:
+                    if e.is_symlink():
+                        continue
+                    if e.is_dir(follow_symlinks=False):
+                        pending.append(e.path)
+                    else:
+                        yield e
+        except (PermissionError, FileNotFoundError):
             continue
-        if p.suffix.lower() in VIDEO_EXTS:
-            vids.append(p)
-    return vids
 
 
 def purge_threat_files(root: Path, run: bool) -> list[Path]:
@@ -231,32 +424,115 @@ def find_existing_show(show: str, year: Optional[int]) -> Optional[Path]:
     return None
 
 
-def find_large_extensionless(root: Path, min_bytes: int = 100 * 1024 * 1024) -> list[Path]:
-    out: list[Path] = []
-    for p in root.rglob("*"):
-        if not p.is_file():
-            continue
-        if p.suffix != "":
+def scan_release(folder: Path, min_bytes: int = 100 * 1024 * 1024) -> tuple[Optional[Path], list[Path], list[Path]]:
+    """Walk a release folder once and return (first_rar, vids, extless).
+
+    Only the highest-priority non-empty category is complete: the walk stops
+    at the first rar, and extensionless files are only stat'd (for min_bytes)
+    when there turn out to be no videos.
+    The walk is breadth-first since rars normally sit at the top of a release.
+    """
+    vids: list[Path] = []
+    extless_candidates: list[os.DirEntry] = []
+    for e in _scandir_breadth_first(folder):
+        if not e.is_file(follow_symlinks=False):
             continue
+        name = e.name.lower()
+        if name.endswith(".rar"):
+            return Path(e.path), vids, []
+        if name.endswith(_VIDEO_SUFFIXES):
+            vids.append(Path(e.path))
+        elif not _ext(name):
+            extless_candidates.append(e)
+    if vids:
+        return None, vids, []
+
+    extless: list[Path] = []
+    for e in extless_candidates:
         try:
-            if p.stat().st_size >= min_bytes:
-                out.append(p)
+            if e.stat(follow_symlinks=False).st_size >= min_bytes:
+                extless.append(Path(e.path))
         except FileNotFoundError:
             continue
-    return out
+    return None, vids, extless
+
+
+def run_cmd(cmd: list[str], tail_lines: int = 50) -> tuple[int, str]:
+    """Run cmd and return (returncode, last tail_lines lines of combined output).
+
+    Output is streamed rather than captured whole; unrar can be very chatty on big
+    releases and only the tail is ever audited.
+    """
+    tail: deque[str] = deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace") as proc:
+        for line in proc.stdout:
+            tail.append(line)
+    return proc.returncode, "".join(tail)
 
 
-def run_cmd(cmd: list[str]) -> tuple[int, str]:
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    return proc.returncode, proc.stdout
+# Dirs already known to exist (or already "created" in dry-run), so repeat calls
+# for the same dest/recycle dir don't stat the NAS again.
+_ensured: set[str] = set()
 
 
 def ensure_dir(path: Path, run: bool) -> None:
-    if path.exists():
+    key = str(path)
+    if key in _ensured:
         return
-    if run:
-        path.mkdir(parents=True, exist_ok=True)
-    log_line(f"mkdir -p {path}")
+    if not path.exists():
+        if run:
+            path.mkdir(parents=True, exist_ok=True)
+        log_line(f"mkdir -p {path}")
+    _ensured.add(key)
+
+
+# ioctl(FICLONE) request number (linux/fs.h); fcntl only exposes it on Python 3.12+.
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+
+def _reflink_move(src: Path, dst: Path) -> bool:
+    """Move a regular file by reflinking it (FICLONE) and unlinking the source.
+
+    Only works when both paths are on the same reflink-capable filesystem (btrfs/xfs)
+    mounted in two places. Returns False, leaving src untouched, when that isn't the case.
+    Like os.rename and shutil.move, an existing dst is overwritten (callers such as
+    move_path decide beforehand what to do about existing destinations).
+    """
+    fd_src = os.open(src, os.O_RDONLY)
+    try:
+        if not stat.S_ISREG(os.fstat(fd_src).st_mode):
+            return False
+        # O_TRUNC: overwriting an existing dst is intended, see docstring.
+        fd_dst = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            fcntl.ioctl(fd_dst, FICLONE, fd_src)
+        except OSError:
+            os.close(fd_dst)
+            os.unlink(dst)
+            return False
+        os.close(fd_dst)
+    finally:
+        os.close(fd_src)
+    shutil.copystat(src, dst)
+    os.unlink(src)
+    return True
+
+
+def _fast_move(src: Path, dst: Path) -> None:
+    """Move src to dst with a plain rename, falling back to a copy across filesystems.
+
+    complete -> #recycle is always the same mount, so that's a single rename regardless
+    of folder size; complete -> media may be a different mount (EXDEV). There we try a
+    metadata-only reflink first, then shutil.move (which copies via sendfile on Linux).
+    """
+    try:
+        os.rename(src, dst)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        if _reflink_move(src, dst):
+            return
+        shutil.move(str(src), str(dst))
 
 
 def move_path(src: Path, dst: Path, run: bool) -> bool:
@@ -274,7 +550,7 @@ def move_path(src: Path, dst: Path, run: bool) -> bool:
     ensure_dir(dst.parent, run)
     if run:
         try:
-            shutil.move(str(src), str(dst))
+            _fast_move(src, dst)
         except FileNotFoundError:
             # Source vanished between detection and move — likely moved by Sonarr.
             log_line(f"SKIP (src vanished, likely moved externally): {src}")
@@ -293,17 +569,47 @@ def extract_rar(rar: Path, dest_dir: Path, run: bool) -> tuple[bool, str]:
     return code == 0, out
 
 
+_recycle_date: Optional[str] = None
+
+
+def recycle_date() -> str:
+    """Date folder under RECYCLE; computed once so a whole run lands in one folder."""
+    global _recycle_date
+    if _recycle_date is None:
+        _recycle_date = dt.datetime.now().strftime("%Y-%m-%d")
+    return _recycle_date
+
+
 def unique_recycle_dest(src_folder: Path) -> Path:
-    date = dt.datetime.now().strftime("%Y-%m-%d")
-    base = RECYCLE / date / src_folder.name
-    if not base.exists():
-        return base
+    base_dir = RECYCLE / recycle_date()
+    # One listdir instead of an exists() round-trip per candidate name.
+    try:
+        existing = set(os.listdir(base_dir))
+    except FileNotFoundError:
+        existing = set()
+    name = src_folder.name
+    if name not in existing:
+        return base_dir / name
     # deconflict
     for i in range(1, 1000):
-        cand = RECYCLE / date / f"{src_folder.name}.{i}"
-        if not cand.exists():
-            return cand
-    return RECYCLE / date / f"{src_folder.name}.{os.getpid()}"
+        cand = f"{name}.{i}"
+        if cand not in existing:
+            return base_dir / cand
+    return base_dir / f"{name}.{os.getpid()}"
+
+
+def recycle_folder(folder: Path, run: bool, note: str = "") -> Path:
+    """Move a processed release folder into the dated #recycle dir. Returns the destination."""
+    # Hold the lock across pick + move so concurrent workers can't claim the same dest.
+    with _recycle_lock:
+        recycle_dest = unique_recycle_dest(folder)
+        ensure_dir(recycle_dest.parent, run)
+        if run:
+            # same filesystem (both under COMPLETE), so this is a rename
+            _fast_move(folder, recycle_dest)
+    label = f"recycle ({note})" if note else "recycle"
+    log_line(f"{label} {folder} -> {recycle_dest}")
+    return recycle_dest
 
 
 def process_straggler(item: Path, run: bool) -> dict:
@@ -321,10 +627,10 @@ def process_straggler(item: Path, run: bool) -> dict:
         # Otherwise purge individual threat files and continue normal processing.
         purge_threat_files(item, run)
 
-        tv = parse_tv(release)
-        if tv:
+        parsed = parse_release(release)
+        if isinstance(parsed, ParsedTV):
             # Check if the show already exists in DST_TV to confirm it's a TV release
-            existing = find_existing_show(tv.show, tv.year)
+            existing = find_existing_show(parsed.show, parsed.year)
             if existing:
                 log_line(f"STRAGGLER TV (matched existing show '{existing.name}'): {release} -> Series/")
             else:
@@ -332,18 +638,13 @@ def process_straggler(item: Path, run: bool) -> dict:
             # Delegate to normal series processor (it handles dest dir creation)
             return process_series_folder(item, run)
 
-        movie = parse_movie(release)
-        if movie:
+        if isinstance(parsed, ParsedMovie):
             log_line(f"STRAGGLER Movie: {release} -> Movies/")
             return process_movie_folder(item, run)
 
         log_line(f"STRAGGLER unclassified folder (can't parse as TV or movie): {release}")
         # Still recycle the folder so it doesn't linger in the source tree
-        recycle_dest = unique_recycle_dest(item)
-        ensure_dir(recycle_dest.parent, run)
-        if run:
-            shutil.move(str(item), str(recycle_dest))
-        log_line(f"recycle (unclassified) {item} -> {recycle_dest}")
+        recycle_dest = recycle_folder(item, run, "unclassified")
         return {**details_base, "kind": "straggler", "status": "error", "reason": "unclassified", "recycled_to": str(recycle_dest)}
 
     # --- loose file straggler ---
@@ -364,23 +665,22 @@ def process_straggler(item: Path, run: bool) -> dict:
 
         # Bare video file — try to classify by filename
         stem = item.stem
-        tv = parse_tv(stem)
-        if tv:
-            show_folder = tv.show if tv.year is None else f"{tv.show} ({tv.year})"
+        parsed = parse_release(stem)
+        if isinstance(parsed, ParsedTV):
+            show_folder = parsed.show if parsed.year is None else f"{parsed.show} ({parsed.year})"
             # Prefer existing show dir if found
-            existing = find_existing_show(tv.show, tv.year)
+            existing = find_existing_show(parsed.show, parsed.year)
             if existing:
                 show_folder = existing.name
-            season_folder = f"Season {tv.season:02d}"
+            season_folder = f"Season {parsed.season:02d}"
             dest_dir = DST_TV / show_folder / season_folder
             log_line(f"STRAGGLER loose TV file -> {dest_dir / item.name}")
             moved = move_path(item, dest_dir / item.name, run)
             status = "ok" if moved else "skipped"
             return {**details_base, "kind": "tv", "status": status, "dest": str(dest_dir)}
 
-        movie = parse_movie(stem)
-        if movie:
-            movie_folder = f"{movie.title} ({movie.year})"
+        if isinstance(parsed, ParsedMovie):
+            movie_folder = f"{parsed.title} ({parsed.year})"
             dest_dir = DST_MOVIES / movie_folder
             log_line(f"STRAGGLER loose movie file -> {dest_dir / item.name}")
             moved = move_path(item, dest_dir / item.name, run)
@@ -393,7 +693,22 @@ def process_straggler(item: Path, run: bool) -> dict:
     return {**details_base, "kind": "straggler", "status": "skipped", "reason": "not_file_or_dir"}
 
 
-def process_series_folder(folder: Path, run: bool) -> dict:
+def release_dest(parsed: ParsedTV | ParsedMovie) -> tuple[str, Path]:
+    """Return (kind, destination dir) for a parsed release."""
+    if isinstance(parsed, ParsedTV):
+        show_folder = parsed.show if parsed.year is None else f"{parsed.show} ({parsed.year})"
+        season_folder = f"Season {parsed.season:02d}"
+        return "tv", DST_TV / show_folder / season_folder
+    movie_folder = f"{parsed.title} ({parsed.year})"
+    return "movie", DST_MOVIES / movie_folder
+
+
+def prepare_series_folder(folder: Path, run: bool) -> ReleasePlan | dict:
+    """Phase 1 for a Series release: malware checks, name parsing and the folder scan.
+
+    Returns a ReleasePlan for commit_release, or a finished result dict when the
+    release can't go any further.
+    """
     release = folder.name
 
     # Nuke immediately if this is a pure malware folder.
@@ -403,70 +718,24 @@ def process_series_folder(folder: Path, run: bool) -> dict:
 
     # Otherwise purge individual threat files and continue.
     purge_threat_files(folder, run)
-    parsed = parse_tv(release)
+    parsed = parse_release(release)
+    if isinstance(parsed, ParsedMovie) and not is_misfiled_movie(release):
+        # e.g. "Show.2005.S13.1080p" or "Show.2024.03.12..." — TV we can't parse, not a movie.
+        parsed = None
     if not parsed:
         msg = f"IRREGULAR TV name (can't parse): {release}"
         log_line(msg)
         return {"kind": "tv", "release": release, "status": "error", "reason": "unparseable", "path": str(folder)}
+    if isinstance(parsed, ParsedMovie):
+        log_line(f"ROUTE movie release found in Series/: {release} -> Movies")
 
-    show_folder = parsed.show if parsed.year is None else f"{parsed.show} ({parsed.year})"
-    season_folder = f"Season {parsed.season:02d}"
-    dest_dir = DST_TV / show_folder / season_folder
+    rar, vids, extless = scan_release(folder)
+    kind, dest_dir = release_dest(parsed)
+    return ReleasePlan(kind=kind, folder=folder, dest_dir=dest_dir, rar=rar, vids=vids, extless=extless)
 
-    ensure_dir(dest_dir, run)
-
-    # decide what to do
-    rar = find_first_rar(folder)
-    vids = find_video_files(folder)
-    extless = find_large_extensionless(folder)
-
-    moved_any = False
-    details: dict = {"kind": "tv", "release": release, "status": "ok", "dest": str(dest_dir), "path": str(folder)}
-
-    if rar:
-        ok, out = extract_rar(rar, dest_dir, run)
-        if not ok:
-            log_line(f"ERROR unrar failed for {rar} (leaving source)")
-            audit({"event": "unrar_failed", "release": release, "rar": str(rar), "output": out[-2000:]})
-            return {**details, "status": "error", "reason": "unrar_failed"}
-        moved_any = True
-    elif vids:
-        for v in vids:
-            if move_path(v, dest_dir / v.name, run):
-                moved_any = True
-    elif extless:
-        # rename using release name
-        for f in extless:
-            new_name = f"{release}.mkv"
-            if move_path(f, dest_dir / new_name, run):
-                moved_any = True
-    else:
-        log_line(f"IRREGULAR: no rar/video files found in {folder}")
-        # Nothing processable (e.g. malware purged, folder now empty) — still recycle the shell
-        recycle_dest = unique_recycle_dest(folder)
-        ensure_dir(recycle_dest.parent, run)
-        if run:
-            shutil.move(str(folder), str(recycle_dest))
-        log_line(f"recycle (no-media) {folder} -> {recycle_dest}")
-        return {**details, "status": "error", "reason": "no_media_found", "recycled_to": str(recycle_dest)}
 
-    if moved_any:
-        # recycle only after success
-        recycle_dest = unique_recycle_dest(folder)
-        ensure_dir(recycle_dest.parent, run)
-        if run:
-            shutil.move(str(folder), str(recycle_dest))
-        log_line(f"recycle {folder} -> {recycle_dest}")
-        details["recycled_to"] = str(recycle_dest)
-    else:
-        # All files were already at destination (externally moved) — treat as ok/skipped
-        log_line(f"SKIP (all files already at dest or src vanished): {folder}")
-        details["status"] = "skipped"
-
-    return details
-
-
-def process_movie_folder(folder: Path, run: bool) -> dict:
+def prepare_movie_folder(folder: Path, run: bool) -> ReleasePlan | dict:
+    """Phase 1 for a Movies release; see prepare_series_folder."""
     release = folder.name
 
     # Nuke immediately if this is a pure malware folder.
@@ -476,70 +745,136 @@ def process_movie_folder(folder: Path, run: bool) -> dict:
 
     # Otherwise purge individual threat files and continue.
     purge_threat_files(folder, run)
-    parsed = parse_movie(release)
+    parsed = parse_release(release)
     if not parsed:
         msg = f"IRREGULAR Movie name (can't parse year): {release}"
         log_line(msg)
         return {"kind": "movie", "release": release, "status": "error", "reason": "unparseable", "path": str(folder)}
+    if isinstance(parsed, ParsedTV):
+        log_line(f"ROUTE TV release found in Movies/: {release} -> TV")
 
-    movie_folder = f"{parsed.title} ({parsed.year})"
-    dest_dir = DST_MOVIES / movie_folder
-    ensure_dir(dest_dir, run)
-
-    rar = find_first_rar(folder)
-    vids = find_video_files(folder)
-    extless = find_large_extensionless(folder)
+    rar, vids, extless = scan_release(folder)
+    kind, dest_dir = release_dest(parsed)
+    return ReleasePlan(kind=kind, folder=folder, dest_dir=dest_dir, rar=rar, vids=vids, extless=extless)
 
-    details: dict = {"kind": "movie", "release": release, "status": "ok", "dest": str(dest_dir), "path": str(folder)}
-    moved_any = False
-
-    if rar:
-        ok, out = extract_rar(rar, dest_dir, run)
-        if not ok:
-            log_line(f"ERROR unrar failed for {rar} (leaving source)")
-            audit({"event": "unrar_failed", "release": release, "rar": str(rar), "output": out[-2000:]})
-            return {**details, "status": "error", "reason": "unrar_failed"}
-        moved_any = True
-    elif vids:
-        for v in vids:
-            if move_path(v, dest_dir / v.name, run):
-                moved_any = True
-    elif extless:
-        for f in extless:
-            new_name = f"{release}.mkv"
-            if move_path(f, dest_dir / new_name, run):
-                moved_any = True
-    else:
-        log_line(f"IRREGULAR: no rar/video files found in {folder}")
-        # Nothing processable (e.g. malware purged, folder now empty) — still recycle the shell
-        recycle_dest = unique_recycle_dest(folder)
-        ensure_dir(recycle_dest.parent, run)
-        if run:
-            shutil.move(str(folder), str(recycle_dest))
-        log_line(f"recycle (no-media) {folder} -> {recycle_dest}")
-        return {**details, "status": "error", "reason": "no_media_found", "recycled_to": str(recycle_dest)}
 
+def _finish_commit(plan: ReleasePlan, details: dict, moved_any: bool, run: bool) -> dict:
     if moved_any:
-        recycle_dest = unique_recycle_dest(folder)
-        ensure_dir(recycle_dest.parent, run)
-        if run:
-            shutil.move(str(folder), str(recycle_dest))
-        log_line(f"recycle {folder} -> {recycle_dest}")
+        # recycle only after success
+        recycle_dest = recycle_folder(plan.folder, run)
         details["recycled_to"] = str(recycle_dest)
     else:
-        # All files already at destination or source vanished — not an error
-        log_line(f"SKIP (all files already at dest or src vanished): {folder}")
+        # All files were already at destination (externally moved) — treat as ok/skipped
+        log_line(f"SKIP (all files already at dest or src vanished): {plan.folder}")
         details["status"] = "skipped"
-
     return details
 
 
+def _commit_rar(plan: ReleasePlan, details: dict, run: bool) -> dict:
+    ok, out = extract_rar(plan.rar, plan.dest_dir, run)
+    if not ok:
+        log_line(f"ERROR unrar failed for {plan.rar} (leaving source)")
+        audit({"event": "unrar_failed", "release": plan.folder.name, "rar": str(plan.rar), "output": out[-2000:]})
+        return {**details, "status": "error", "reason": "unrar_failed"}
+    return _finish_commit(plan, details, True, run)
+
+
+def _commit_vids(plan: ReleasePlan, details: dict, run: bool) -> dict:
+    moved_any = False
+    for v in plan.vids:
+        if move_path(v, plan.dest_dir / v.name, run):
+            moved_any = True
+    return _finish_commit(plan, details, moved_any, run)
+
+
+def _commit_extless(plan: ReleasePlan, details: dict, run: bool) -> dict:
+    # rename using release name
+    new_name = f"{plan.folder.name}.mkv"
+    moved_any = False
+    for f in plan.extless:
+        if move_path(f, plan.dest_dir / new_name, run):
+            moved_any = True
+    return _finish_commit(plan, details, moved_any, run)
+
+
+def _commit_none(plan: ReleasePlan, details: dict, run: bool) -> dict:
+    log_line(f"IRREGULAR: no rar/video files found in {plan.folder}")
+    # Nothing processable (e.g. malware purged, folder now empty) — still recycle the shell
+    recycle_dest = recycle_folder(plan.folder, run, "no-media")
+    return {**details, "status": "error", "reason": "no_media_found", "recycled_to": str(recycle_dest)}
+
+
+_COMMIT_ACTIONS = {
+    "rar": _commit_rar,
+    "vids": _commit_vids,
+    "extless": _commit_extless,
+    "none": _commit_none,
+}
+
+
+def commit_release(plan: ReleasePlan, run: bool) -> dict:
+    """Phase 2: extract/move the release into its destination, then recycle the source.
+
+    Commits into the same dest dir are serialized; different dest dirs run concurrently.
+    """
+    details: dict = {
+        "kind": plan.kind, "release": plan.folder.name, "status": "ok",
+        "dest": str(plan.dest_dir), "path": str(plan.folder),
+    }
+    with dest_lock(plan.dest_dir):
+        ensure_dir(plan.dest_dir, run)
+        return _COMMIT_ACTIONS[plan.action](plan, details, run)
+
+
+def release_exception_result(plan: ReleasePlan, exc: BaseException) -> dict:
+    """Error result for a release whose commit raised; logging it is best-effort."""
+    result = {
+        "kind": plan.kind, "release": plan.folder.name, "status": "error",
+        "reason": "exception", "error": repr(exc), "path": str(plan.folder),
+    }
+    try:
+        # !r so odd (e.g. surrogate-escaped) names can't make the log line itself fail
+        log_line(f"ERROR processing {str(plan.folder)!r}: {exc!r}")
+    except Exception:
+        pass
+    return result
+
+
+def commit_release_safe(plan: ReleasePlan, run: bool) -> dict:
+    """commit_release for worker threads: an exception becomes an error result for that release."""
+    try:
+        return commit_release(plan, run)
+    except Exception as exc:
+        return release_exception_result(plan, exc)
+
+
+def process_series_folder(folder: Path, run: bool) -> dict:
+    plan = prepare_series_folder(folder, run)
+    if isinstance(plan, dict):
+        return plan
+    return commit_release(plan, run)
+
+
+def process_movie_folder(folder: Path, run: bool) -> dict:
+    plan = prepare_movie_folder(folder, run)
+    if isinstance(plan, dict):
+        return plan
+    return commit_release(plan, run)
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--run", action="store_true", help="Perform changes (default is dry-run)")
+    ap.add_argument(
+        "--jobs", type=int, default=DEFAULT_JOBS,
+        help=f"Number of releases to process concurrently (default {DEFAULT_JOBS})",
+    )
     args = ap.parse_args()
 
     run = bool(args.run)
+    jobs = max(1, args.jobs)
+
+    open_logs()
 
     # best-effort single-instance lock
     LOCK_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -560,7 +895,7 @@ def main() -> int:
             log_line(f"ERROR missing path: {p}")
             return 2
 
-    log_line(f"process-downloads start mode={'RUN' if run else 'DRY_RUN'}")
+    log_line(f"process-downloads start mode={'RUN' if run else 'DRY_RUN'} jobs={jobs}")
     audit({"event": "start", "mode": "run" if run else "dry"})
 
     results: list[dict] = []
@@ -575,26 +910,48 @@ def main() -> int:
         results.append(r)
         audit({"event": "straggler", **r})
 
-    # process Series folders (each release is usually its own folder)
-    for item in iter_items(SRC_SERIES):
-        if not item.is_dir():
-            continue
-        r = process_series_folder(item, run)
+    # process Series and Movies folders (each release is usually its own folder).
+    # Pipelined: this thread prepares (scans) the next release while workers commit
+    # (unrar/move/recycle) earlier ones. Commits also overlap with each other, except
+    # that releases sharing a dest dir (e.g. episodes of one season) take turns; see
+    # commit_release.
+    # The semaphore bounds how many prepared plans can wait ahead of the workers.
+    # Each result is audited as soon as it's known, so anything already moved is
+    # on record even if the run dies part-way through.
+    slots = threading.BoundedSemaphore(jobs + 2)
+
+    def record(r: dict) -> None:
         results.append(r)
         audit({"event": "item", **r})
 
-    for item in iter_items(SRC_MOVIES):
-        if not item.is_dir():
-            continue
-        r = process_movie_folder(item, run)
-        results.append(r)
-        audit({"event": "item", **r})
+    def on_commit_done(fut: Future, plan: ReleasePlan) -> None:
+        try:
+            try:
+                r = fut.result()
+            except Exception as exc:
+                r = release_exception_result(plan, exc)
+            record(r)
+        finally:
+            slots.release()
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        work = [(prepare_series_folder, item) for item in iter_items(SRC_SERIES, dirs_only=True)]
+        work += [(prepare_movie_folder, item) for item in iter_items(SRC_MOVIES, dirs_only=True)]
+        for prepare, item in work:
+            plan = prepare(item, run)
+            if isinstance(plan, dict):
+                record(plan)
+                continue
+            slots.acquire()
+            fut = executor.submit(commit_release_safe, plan, run)
+            fut.add_done_callback(lambda f, plan=plan: on_commit_done(f, plan))
 
     ok = sum(1 for r in results if r.get("status") == "ok")
     skipped = sum(1 for r in results if r.get("status") == "skipped")
     err = sum(1 for r in results if r.get("status") not in ("ok", "skipped"))
     log_line(f"process-downloads done ok={ok} skipped={skipped} error={err}")
     audit({"event": "done", "ok": ok, "skipped": skipped, "error": err})
+    close_logs()
 
     return 0 if err == 0 else 1
 